@@ -0,0 +1,6 @@
+"""Airflow Datasets shared by the XKCD DAGs."""
+
+from airflow.datasets import Dataset
+
+# Updated by xkcd_pipeline.ingest_xkcd_comics, schedules xkcd_transform
+XKCD_COMICS_DATASET = Dataset("postgres://postgres:5432/warehouse/raw/xkcd_comics")
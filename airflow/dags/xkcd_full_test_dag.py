@@ -0,0 +1,42 @@
+"""XKCD Full Test DAG - Runs every dbt test over the full history on a slow schedule."""
+
+from datetime import timedelta
+
+import pendulum
+
+from airflow.decorators import dag
+from airflow.operators.bash import BashOperator
+
+START_DATE = pendulum.datetime(2025, 1, 1, tz="UTC")
+
+
+@dag(
+    dag_id="xkcd_full_test",
+    description="Full-table dbt tests for XKCD models",
+    schedule="0 6 * * 0",
+    start_date=START_DATE,
+    catchup=False,
+    tags=["xkcd"],
+    is_paused_upon_creation=True,
+    default_args={
+        "owner": "data-engineering",
+        "depends_on_past": False,
+        "email_on_failure": False,
+        "email_on_retry": False,
+        "retries": 1,
+        "retry_delay": timedelta(minutes=5),
+    },
+)
+def xkcd_full_test():
+    """XKCD full test DAG."""
+
+    BashOperator(
+        task_id="dbt_test_full",
+        bash_command=(
+            "cd /opt/airflow/dbt && dbt test --target airflow --profiles-dir /home/airflow/.dbt "
+            "--vars '{test_scope: full}'"
+        ),
+    )
+
+
+xkcd_full_test()
@@ -1,12 +1,17 @@
 """XKCD Pipeline DAG."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+import pendulum
 
 from airflow.decorators import dag, task
-from airflow.utils.dates import days_ago
-from airflow.operators.bash import BashOperator
+from airflow.exceptions import AirflowSkipException
 from airflow.operators.empty import EmptyOperator
 from airflow.sensors.python import PythonSensor
+from xkcd_datasets import XKCD_COMICS_DATASET
+
+# Fixed start date: days_ago() is deprecated and re-evaluated on every parse
+START_DATE = pendulum.datetime(2025, 1, 1, tz="UTC")
 
 SENSOR_TIMEOUT_SECONDS = 43200  # 12 hours
 SENSOR_POKE_INTERVAL_SECONDS = 300  # 5 minutes
@@ -16,7 +21,7 @@ SENSOR_POKE_INTERVAL_SECONDS = 300  # 5 minutes
     dag_id="xkcd_pipeline",
     description="XKCD comics pipeline",
     schedule="0 12 * * 1,3,5",
-    start_date=days_ago(1),
+    start_date=START_DATE,
     catchup=False,
     tags=["xkcd"],
     is_paused_upon_creation=True,
@@ -40,8 +45,8 @@ def xkcd_pipeline():
         return should_skip_sensor(**context)
 
     def check_new_comic_callable():
-        """Check if a new comic is available (delayed import for sensor)."""
-        from ingestion.poller import check_new_comic_available
+        """Check if a new comic is available via the ingestion worker (delayed import for sensor)."""
+        from ingestion.client import check_new_comic_available
 
         return check_new_comic_available()
 
@@ -56,30 +61,22 @@ def xkcd_pipeline():
 
     skip_sensor_task = EmptyOperator(task_id="skip_sensor")
 
-    @task(trigger_rule="none_failed_or_skipped")
-    def ingest_xkcd_comics():
-        """Run XKCD ingestion."""
-        from ingestion.run_ingestion import main
-
-        main()
+    @task(trigger_rule="none_failed_or_skipped", outlets=[XKCD_COMICS_DATASET])
+    def ingest_xkcd_comics(dag_run=None, outlet_events=None):
+        """Run XKCD ingestion on the worker, skipping (no dataset update) when nothing was loaded."""
+        from ingestion.client import request_ingestion
 
-    dbt_run_task = BashOperator(
-        task_id="dbt_run",
-        bash_command="cd /opt/airflow/dbt && dbt run --target airflow --profiles-dir /home/airflow/.dbt",
-        trigger_rule="none_failed_or_skipped",
-    )
-
-    dbt_test_task = BashOperator(
-        task_id="dbt_test",
-        bash_command="cd /opt/airflow/dbt && dbt test --target airflow --profiles-dir /home/airflow/.dbt",
-        trigger_rule="none_failed_or_skipped",
-    )
+        # Every load_ts written by this run, including by failed earlier tries, is at or
+        # after the run's start, so xkcd_transform can scope its tests to all of them
+        since_load_ts = dag_run.start_date.isoformat()
+        if not request_ingestion():
+            raise AirflowSkipException("No new comics loaded")
+        outlet_events[XKCD_COMICS_DATASET].extra = {"since_load_ts": since_load_ts}
 
     ingest_task = ingest_xkcd_comics()
     sensor_branch_task = sensor_branch()
 
     sensor_branch_task >> [wait_for_new_comic_task, skip_sensor_task] >> ingest_task
-    ingest_task >> dbt_run_task >> dbt_test_task
 
 
 xkcd_pipeline()
@@ -0,0 +1,77 @@
+"""XKCD Transform DAG - Runs dbt as soon as the ingestion DAG updates the raw comics dataset."""
+
+from datetime import timedelta
+
+import pendulum
+
+from airflow.decorators import dag, task
+from airflow.operators.bash import BashOperator
+from xkcd_datasets import XKCD_COMICS_DATASET
+
+START_DATE = pendulum.datetime(2025, 1, 1, tz="UTC")
+
+
+@dag(
+    dag_id="xkcd_transform",
+    description="XKCD dbt transforms, triggered by new raw comics",
+    schedule=[XKCD_COMICS_DATASET],
+    start_date=START_DATE,
+    catchup=False,
+    tags=["xkcd"],
+    is_paused_upon_creation=True,
+    max_active_runs=1,
+    default_args={
+        "owner": "data-engineering",
+        "depends_on_past": False,
+        "email_on_failure": False,
+        "email_on_retry": False,
+        "retries": 3,
+        "retry_delay": timedelta(minutes=5),
+    },
+)
+def xkcd_transform():
+    """XKCD transform DAG."""
+
+    @task
+    def load_window(triggering_dataset_events=None):
+        """Earliest load start among the ingestion runs that triggered this run."""
+        starts = [
+            pendulum.parse(event.extra["since_load_ts"])
+            for event in triggering_dataset_events.get(XKCD_COMICS_DATASET.uri, [])
+            if (event.extra or {}).get("since_load_ts")
+        ]
+        # Manual runs have no events and fall back to the newest load
+        return min(starts).isoformat() if starts else ""
+
+    load_window_task = load_window()
+
+    dbt_run_task = BashOperator(
+        task_id="dbt_run",
+        bash_command="cd /opt/airflow/dbt && dbt run --target airflow --profiles-dir /home/airflow/.dbt",
+    )
+
+    # Only checks rows from the loads behind this run; xkcd_full_test covers the whole history
+    dbt_test_task = BashOperator(
+        task_id="dbt_test",
+        bash_command=(
+            "cd /opt/airflow/dbt && dbt test --target airflow --profiles-dir /home/airflow/.dbt "
+            "--vars \"{test_scope: latest, since_load_ts: '$SINCE_LOAD_TS'}\""
+        ),
+        env={"SINCE_LOAD_TS": "{{ ti.xcom_pull(task_ids='load_window') }}"},
+        append_env=True,
+    )
+
+    # Unwindowed: every comic without features is picked up, including those loaded by
+    # task tries that failed before a run that emitted a dataset event
+    @task
+    def compute_text_features():
+        """Compute text features for comics that have none yet."""
+        from ingestion.text_features import run_text_features
+
+        run_text_features()
+
+    [dbt_run_task, load_window_task] >> dbt_test_task
+    compute_text_features()
+
+
+xkcd_transform()
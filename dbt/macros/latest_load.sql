@@ -0,0 +1,43 @@
+-- Scope data tests to the most recent loads when run with --vars '{test_scope: latest}'.
+-- Callers that know which loads they are testing pass the earliest one's load_ts
+-- as since_load_ts, so batched or combined loads are all covered. A specific load
+-- can be pinned with load_id; with neither, the newest load_ts in the relation is used.
+
+{% macro latest_load_predicate(relation, column_prefix='') -%}
+    {%- if var('test_scope', 'full') == 'latest' -%}
+        {%- if var('load_id', none) -%}
+            {{ column_prefix }}load_id = '{{ var("load_id") }}'::uuid
+        {%- elif var('since_load_ts', none) -%}
+            {#- load_ts is a timestamp; cast the bound, not the column, so load_ts indexes apply #}
+            {{ column_prefix }}load_ts >= '{{ var("since_load_ts") }}'::timestamptz::timestamp
+        {%- else -%}
+            {{ column_prefix }}load_ts = (select max(load_ts) from {{ relation }})
+        {%- endif -%}
+    {%- else -%}
+        true
+    {%- endif -%}
+{%- endmacro %}
+
+
+-- Generic tests get `where: __latest_load__` from dbt_project.yml; swap the
+-- placeholder for the predicate on the relation under test. Relations without
+-- load_ts (e.g. the small rollup marts) are always tested in full.
+{% macro get_where_subquery(relation) -%}
+    {%- set where = config.get('where', '') -%}
+    {%- if where -%}
+        {%- set predicate = 'true' -%}
+        {%- if execute and var('test_scope', 'full') == 'latest' -%}
+            {%- set columns = adapter.get_columns_in_relation(relation) | map(attribute='name') | list -%}
+            {%- if 'load_ts' in columns -%}
+                {%- set predicate = latest_load_predicate(relation) -%}
+            {%- endif -%}
+        {%- endif -%}
+        {%- set where = where | replace('__latest_load__', predicate) -%}
+        {%- set filtered -%}
+            (select * from {{ relation }} where {{ where }}) dbt_subquery
+        {%- endset -%}
+        {%- do return(filtered) -%}
+    {%- else -%}
+        {%- do return(relation) -%}
+    {%- endif -%}
+{%- endmacro %}
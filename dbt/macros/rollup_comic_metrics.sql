@@ -0,0 +1,84 @@
+-- Aggregate comic metrics to the given grain, maintained incrementally.
+-- On incremental runs only fact rows scored after the rollup's last_processed_ts
+-- are aggregated, then added to the existing totals of the affected groups; the
+-- model's delete+insert strategy replaces just those groups.
+-- `grain` maps output column names to expressions over publish_date.
+
+{% macro rollup_comic_metrics(grain) -%}
+{%- set grain_columns = grain.keys() | list -%}
+
+with new_comics as (
+    select
+        dim.publish_date,
+        fct.cost_euros,
+        fct.customer_review_score,
+        fct.view_count,
+        fct.processed_ts
+    from {{ ref('fct_comic_metrics') }} as fct
+    inner join {{ ref('dim_comic') }} as dim
+        on fct.comic_id = dim.comic_id
+    {% if is_incremental() -%}
+    where fct.processed_ts > (
+        select coalesce(max(last_processed_ts), '-infinity'::timestamp)
+        from {{ this }}
+    )
+    {%- endif %}
+),
+
+delta as (
+    select
+        {% for column, expression in grain.items() -%}
+        {{ expression }} as {{ column }},
+        {% endfor -%}
+        count(*) as comic_count,
+        sum(cost_euros) as total_cost_euros,
+        sum(customer_review_score) as review_score_sum,
+        sum(view_count) as total_view_count,
+        max(processed_ts) as last_processed_ts
+    from new_comics
+    group by {{ grain_columns | join(', ') }}
+),
+
+merged as (
+    select
+        {% for column in grain_columns -%}
+        delta.{{ column }},
+        {% endfor -%}
+        {% if is_incremental() -%}
+        delta.comic_count + coalesce(existing.comic_count, 0) as comic_count,
+        delta.total_cost_euros + coalesce(existing.total_cost_euros, 0) as total_cost_euros,
+        delta.review_score_sum + coalesce(existing.review_score_sum, 0) as review_score_sum,
+        delta.total_view_count + coalesce(existing.total_view_count, 0) as total_view_count,
+        {% else -%}
+        delta.comic_count,
+        delta.total_cost_euros,
+        delta.review_score_sum,
+        delta.total_view_count,
+        {% endif -%}
+        delta.last_processed_ts
+    from delta
+    {% if is_incremental() -%}
+    left join {{ this }} as existing
+        on {% for column in grain_columns -%}
+        {{ 'and ' if not loop.first }}delta.{{ column }} = existing.{{ column }}
+        {% endfor -%}
+    {%- endif %}
+),
+
+final as (
+    select
+        {% for column in grain_columns -%}
+        {{ column }},
+        {% endfor -%}
+        comic_count,
+        total_cost_euros,
+        (review_score_sum / comic_count)::numeric(4, 2) as avg_customer_review_score,
+        review_score_sum,
+        total_view_count,
+        last_processed_ts
+    from merged
+)
+
+select *
+from final
+{%- endmacro %}
@@ -0,0 +1,4 @@
+{{ rollup_comic_metrics({
+    'publish_year': 'extract(year from publish_date)::integer',
+    'publish_month': 'extract(month from publish_date)::integer',
+}) }}
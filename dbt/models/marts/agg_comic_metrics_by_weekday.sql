@@ -0,0 +1,4 @@
+{{ rollup_comic_metrics({
+    'publish_weekday': 'extract(isodow from publish_date)::integer',
+    'weekday_name': "trim(to_char(publish_date, 'Day'))",
+}) }}
@@ -0,0 +1,3 @@
+{{ rollup_comic_metrics({
+    'publish_year': 'extract(year from publish_date)::integer',
+}) }}
@@ -7,7 +7,9 @@ with staging as (
         img_url,
         transcript,
         link,
-        publish_date
+        publish_date,
+        load_ts,
+        load_id
     from {{ ref('stg_xkcd_comics') }}
 ),
 
@@ -21,7 +23,9 @@ final as (
         transcript,
         link,
         publish_date,
-        char_length(title) as title_length
+        char_length(title) as title_length,
+        load_ts,
+        load_id
     from staging
 )
 
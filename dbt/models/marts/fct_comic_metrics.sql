@@ -1,8 +1,21 @@
 with dim_comic as (
     select
         comic_id,
-        title_length
-    from {{ ref('dim_comic') }}
+        title_length,
+        load_ts,
+        load_id
+    from {{ ref('dim_comic') }} as dim
+    {% if is_incremental() -%}
+    -- Only score comics from loads not yet scored, so metrics stay stable for rollups.
+    -- Matched per comic rather than on a load_ts watermark: a load's batches share one
+    -- load_ts but commit separately, and later batches may land after a build.
+    where not exists (
+        select 1
+        from {{ this }} as scored
+        where scored.comic_id = dim.comic_id
+            and scored.load_id = dim.load_id
+    )
+    {%- endif %}
 ),
 
 metrics as (
@@ -13,7 +26,11 @@ metrics as (
         -- Views are random number between 0 and 1 multiplied by 10000
         (random() * 10000)::integer as view_count,
         -- Reviews are a random number between 1.0 and 10.0
-        (1.0 + random() * 9.0)::numeric(4, 1) as customer_review_score
+        (1.0 + random() * 9.0)::numeric(4, 1) as customer_review_score,
+        load_ts,
+        load_id,
+        -- Watermark for the rollups: increases with every build, unlike load_ts
+        current_timestamp::timestamp as processed_ts
     from dim_comic
 ),
 
@@ -22,7 +39,10 @@ final as (
         comic_id,
         view_count,
         cost_euros,
-        customer_review_score
+        customer_review_score,
+        load_ts,
+        load_id,
+        processed_ts
     from metrics
 )
 
@@ -9,4 +9,5 @@ from {{ ref('fct_comic_metrics') }} as fct
 inner join {{ ref('dim_comic') }} as dim
     on fct.comic_id = dim.comic_id
 where fct.cost_euros != (dim.title_length * 5.0)::numeric(10, 2)
+    and {{ latest_load_predicate(ref('fct_comic_metrics'), 'fct.') }}
 
@@ -2,5 +2,5 @@
 
 select comic_id, customer_review_score
 from {{ ref('fct_comic_metrics') }}
-where customer_review_score < 1.0 or customer_review_score > 10.0
-
+where ({{ latest_load_predicate(ref('fct_comic_metrics')) }})
+    and (customer_review_score < 1.0 or customer_review_score > 10.0)
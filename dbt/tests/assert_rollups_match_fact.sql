@@ -0,0 +1,44 @@
+-- Test: Incrementally maintained rollups must add up to the fact table
+-- (full scope only: it reads the whole fact table)
+
+{{ config(enabled=var('test_scope', 'full') == 'full') }}
+
+with fact_totals as (
+    select
+        count(*) as comic_count,
+        sum(cost_euros) as total_cost_euros,
+        sum(view_count) as total_view_count
+    from {{ ref('fct_comic_metrics') }}
+),
+
+rollup_totals as (
+    select 'year' as rollup, comic_count, total_cost_euros, total_view_count
+    from {{ ref('agg_comic_metrics_by_year') }}
+
+    union all
+
+    select 'month' as rollup, comic_count, total_cost_euros, total_view_count
+    from {{ ref('agg_comic_metrics_by_month') }}
+
+    union all
+
+    select 'weekday' as rollup, comic_count, total_cost_euros, total_view_count
+    from {{ ref('agg_comic_metrics_by_weekday') }}
+),
+
+summed as (
+    select
+        rollup,
+        sum(comic_count) as comic_count,
+        sum(total_cost_euros) as total_cost_euros,
+        sum(total_view_count) as total_view_count
+    from rollup_totals
+    group by rollup
+)
+
+select summed.*
+from summed
+cross join fact_totals
+where summed.comic_count != fact_totals.comic_count
+    or summed.total_cost_euros != fact_totals.total_cost_euros
+    or summed.total_view_count != fact_totals.total_view_count
@@ -2,5 +2,5 @@
 
 select comic_id, view_count
 from {{ ref('fct_comic_metrics') }}
-where view_count < 0 or view_count > 10000
-
+where ({{ latest_load_predicate(ref('fct_comic_metrics')) }})
+    and (view_count < 0 or view_count > 10000)
@@ -0,0 +1,49 @@
+"""XKCD ingestion package.
+
+Public entry points are imported lazily so that importing the package (for example
+from an Airflow DAG file at parse time) does not load requests, pydantic, psycopg2
+or tenacity until an entry point is actually used inside a task.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ingestion.client import check_new_comic_available, request_ingestion, send_command
+    from ingestion.extractor import XKCDComic, XKCDExtractor
+    from ingestion.loader import DatabaseConfig, XKCDLoader
+
+_LAZY_IMPORTS = {
+    "XKCDComic": "ingestion.extractor",
+    "XKCDExtractor": "ingestion.extractor",
+    "DatabaseConfig": "ingestion.loader",
+    "XKCDLoader": "ingestion.loader",
+    "check_new_comic_available": "ingestion.client",
+    "request_ingestion": "ingestion.client",
+    "send_command": "ingestion.client",
+}
+
+__all__ = [
+    "DatabaseConfig",
+    "XKCDComic",
+    "XKCDExtractor",
+    "XKCDLoader",
+    "check_new_comic_available",
+    "request_ingestion",
+    "send_command",
+]
+
+
+def __getattr__(name: str):
+    """Import public entry points on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazy entry points in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,117 @@
+"""Ingestion Client - Sends run requests to the warm ingestion worker.
+
+Only uses the standard library so Airflow tasks and sensor pokes that call it do not
+pay for importing requests, pydantic, psycopg2 and tenacity.
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_HOST = "localhost"
+DEFAULT_WORKER_PORT = 8765
+COMMANDS = ("ping", "check", "ingest")
+# Requests run one at a time, so a check can queue behind a long ingest
+CHECK_TIMEOUT_SECONDS = 30.0
+
+
+class WorkerUnavailableError(RuntimeError):
+    """Raised when the ingestion worker cannot be reached."""
+
+
+class WorkerTimeoutError(RuntimeError):
+    """Raised when the ingestion worker does not answer within the read timeout."""
+
+
+def worker_address() -> tuple[str, int]:
+    """Read the worker address from the environment."""
+    host = os.environ.get("INGESTION_WORKER_HOST", DEFAULT_WORKER_HOST)
+    port = int(os.environ.get("INGESTION_WORKER_PORT", DEFAULT_WORKER_PORT))
+    return host, port
+
+
+def send_command(
+    command: str,
+    address: tuple[str, int] | None = None,
+    connect_timeout: float = 5.0,
+    timeout: float | None = None,
+):
+    """Send a command to the worker and return its result."""
+    if command not in COMMANDS:
+        raise ValueError(f"Unknown command: {command}")
+
+    address = address if address is not None else worker_address()
+    try:
+        sock = socket.create_connection(address, timeout=connect_timeout)
+    except OSError as e:
+        raise WorkerUnavailableError(f"Ingestion worker not reachable at {address}: {e}") from e
+
+    with sock, sock.makefile("rwb") as stream:
+        sock.settimeout(timeout)
+        stream.write(json.dumps({"command": command}).encode() + b"\n")
+        stream.flush()
+        try:
+            line = stream.readline()
+        except TimeoutError as e:
+            raise WorkerTimeoutError(
+                f"Ingestion worker did not answer '{command}' within {timeout}s"
+            ) from e
+
+    if not line:
+        raise RuntimeError(f"Ingestion worker closed the connection during '{command}'")
+
+    response = json.loads(line)
+    if not response["ok"]:
+        raise RuntimeError(f"Ingestion worker failed '{command}': {response['error']}")
+    return response["result"]
+
+
+def check_new_comic_available() -> bool:
+    """Check for a new comic via the worker, falling back to an in-process check.
+
+    A busy worker (e.g. mid-ingest) is reported as no new comic, so the sensor
+    reschedules its poke instead of holding a slot.
+    """
+    try:
+        return send_command("check", timeout=CHECK_TIMEOUT_SECONDS)
+    except WorkerUnavailableError as e:
+        logger.warning(f"{e}, checking in-process")
+    except WorkerTimeoutError as e:
+        logger.warning(f"{e}, checking again on the next poke")
+        return False
+    except RuntimeError as e:
+        logger.error(f"Failed to check for new comic: {e}")
+        return False
+
+    from ingestion.poller import check_new_comic_available as check_in_process
+
+    return check_in_process()
+
+
+def request_ingestion() -> int:
+    """Run ingestion via the worker, falling back to an in-process run."""
+    try:
+        return send_command("ingest")
+    except WorkerUnavailableError as e:
+        logger.warning(f"{e}, ingesting in-process")
+
+    from ingestion.run_ingestion import main
+
+    return main()
+
+
+def main():
+    """Send a single command to the worker and print the result."""
+    parser = argparse.ArgumentParser(description="Send a command to the ingestion worker")
+    parser.add_argument("command", choices=COMMANDS)
+    args = parser.parse_args()
+
+    print(json.dumps(send_command(args.command)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""dbt Benchmark - Records per-model and per-test runtimes from dbt run_results.json."""
+
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import psycopg2
+from psycopg2.extras import execute_values
+from pydantic import BaseModel
+
+from ingestion.loader import XKCDLoader
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class NodeTiming(BaseModel):
+    """Runtime of a single dbt node within one invocation."""
+
+    invocation_id: str
+    generated_at: datetime
+    unique_id: str
+    resource_type: str
+    status: str
+    execution_time_s: float
+
+
+def parse_run_results(run_results: dict) -> list[NodeTiming]:
+    """Extract node timings from a parsed run_results.json document."""
+    metadata = run_results["metadata"]
+    return [
+        NodeTiming(
+            invocation_id=metadata["invocation_id"],
+            generated_at=metadata["generated_at"],
+            unique_id=result["unique_id"],
+            resource_type=result["unique_id"].split(".", 1)[0],
+            status=result["status"],
+            execution_time_s=result["execution_time"],
+        )
+        for result in run_results["results"]
+    ]
+
+
+def count_raw_rows(conn: psycopg2.extensions.connection) -> int:
+    """Count rows in the raw comics table, the scale the benchmark ran at."""
+    with conn.cursor() as cur:
+        cur.execute("select count(*) from raw.xkcd_comics")
+        return cur.fetchone()[0]
+
+
+def record_timings(
+    conn: psycopg2.extensions.connection, timings: list[NodeTiming], raw_row_count: int
+) -> None:
+    """Append node timings to the benchmark history table."""
+    with conn.cursor() as cur:
+        execute_values(
+            cur,
+            """
+            insert into benchmark.dbt_node_timings (
+                invocation_id, generated_at, raw_row_count,
+                unique_id, resource_type, status, execution_time_s
+            )
+            values %s
+            on conflict (invocation_id, unique_id) do nothing
+            """,
+            [
+                (
+                    t.invocation_id,
+                    t.generated_at,
+                    raw_row_count,
+                    t.unique_id,
+                    t.resource_type,
+                    t.status,
+                    t.execution_time_s,
+                )
+                for t in timings
+            ],
+        )
+    conn.commit()
+    logger.info(f"Recorded {len(timings)} node timings at {raw_row_count} raw rows")
+
+
+def find_regressions(
+    conn: psycopg2.extensions.connection, invocation_id: str, threshold: float = 1.5
+) -> list[tuple[str, float, float]]:
+    """Find nodes slower than threshold x their historical mean at the same scale.
+
+    Runs are compared within order-of-magnitude buckets of the raw row count, so a
+    baseline survives the few comics loaded between two benchmark runs.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            with current_run as (
+                select unique_id, raw_row_count, execution_time_s
+                from benchmark.dbt_node_timings
+                where invocation_id = %(invocation_id)s
+            ),
+
+            baseline as (
+                select
+                    history.unique_id,
+                    avg(history.execution_time_s) as baseline_s
+                from benchmark.dbt_node_timings as history
+                inner join current_run
+                    on history.unique_id = current_run.unique_id
+                    and round(log(greatest(history.raw_row_count, 1)))
+                    = round(log(greatest(current_run.raw_row_count, 1)))
+                where history.invocation_id != %(invocation_id)s
+                    and history.status in ('success', 'pass')
+                group by history.unique_id
+            )
+
+            select current_run.unique_id, baseline.baseline_s, current_run.execution_time_s
+            from current_run
+            inner join baseline
+                on current_run.unique_id = baseline.unique_id
+            where current_run.execution_time_s > baseline.baseline_s * %(threshold)s
+            order by current_run.execution_time_s - baseline.baseline_s desc
+            """,
+            {"invocation_id": invocation_id, "threshold": threshold},
+        )
+        return cur.fetchall()
+
+
+def main():
+    """Record a dbt invocation's timings and report regressions."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--run-results", default="dbt/target/run_results.json", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.5, help="regression ratio")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    timings = parse_run_results(json.loads(args.run_results.read_text()))
+    if not timings:
+        logger.warning(f"No results found in {args.run_results}")
+        return
+
+    try:
+        with XKCDLoader() as loader:
+            record_timings(loader.conn, timings, count_raw_rows(loader.conn))
+            regressions = find_regressions(loader.conn, timings[0].invocation_id, args.threshold)
+
+    except (RuntimeError, psycopg2.Error) as e:
+        logger.error(f"Benchmark recording failed: {e}", exc_info=True)
+        sys.exit(1)
+
+    for unique_id, baseline_s, execution_time_s in regressions:
+        logger.warning(
+            f"Regression: {unique_id} took {execution_time_s:.2f}s (mean {baseline_s:.2f}s)"
+        )
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Load Listener - Triggers downstream transforms as soon as comics land in the warehouse."""
+
+import argparse
+import json
+import logging
+import select
+import subprocess
+import sys
+from collections.abc import Generator, Iterable
+from datetime import datetime
+
+import psycopg2
+from pydantic import BaseModel, ValidationError
+
+from ingestion.loader import LOAD_NOTIFY_CHANNEL, XKCDLoader
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DBT_SELECTOR = "source:raw.xkcd_comics+"
+
+
+class LoadEvent(BaseModel):
+    """Change event emitted by the loader for each committed batch."""
+
+    load_id: str
+    load_ts: datetime
+    min_comic_id: int
+    max_comic_id: int
+    comic_count: int
+
+
+def _drain_notifies(conn: psycopg2.extensions.connection) -> list[LoadEvent]:
+    """Parse all pending notifications on the connection."""
+    conn.poll()
+    events = []
+    while conn.notifies:
+        notify = conn.notifies.pop(0)
+        try:
+            events.append(LoadEvent.model_validate_json(notify.payload))
+        except ValidationError as e:
+            logger.warning(f"Ignoring malformed load event {notify.payload!r}: {e}")
+    return events
+
+
+def listen_for_loads(
+    conn: psycopg2.extensions.connection,
+    poll_timeout: float = 60.0,
+    debounce_seconds: float = 5.0,
+) -> Generator[list[LoadEvent], None, None]:
+    """Yield groups of load events, waiting until batches stop arriving before yielding."""
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(f"listen {LOAD_NOTIFY_CHANNEL}")
+    logger.info(f"Listening for load events on channel '{LOAD_NOTIFY_CHANNEL}'")
+
+    while True:
+        if select.select([conn], [], [], poll_timeout) == ([], [], []):
+            continue
+
+        events = _drain_notifies(conn)
+        # A single ingestion run commits many batches, collect them into one trigger
+        while events and select.select([conn], [], [], debounce_seconds) != ([], [], []):
+            events.extend(_drain_notifies(conn))
+
+        if events:
+            yield events
+
+
+def latest_scope_vars(since_load_ts: datetime | None = None) -> str:
+    """Build dbt --vars that scope tests to loads at or after since_load_ts."""
+    dbt_vars = {"test_scope": "latest"}
+    if since_load_ts is not None:
+        dbt_vars["since_load_ts"] = since_load_ts.isoformat()
+    return json.dumps(dbt_vars)
+
+
+def run_transforms(events: list[LoadEvent], dbt_args: list[str], project_dir: str) -> bool:
+    """Run dbt for the models downstream of the raw comics source.
+
+    Tests are scoped to every load in the batch of events, not just the newest one.
+    """
+    load_ids = sorted({event.load_id for event in events})
+    comic_count = sum(event.comic_count for event in events)
+    logger.info(f"Triggering transforms for {comic_count} comics from loads {load_ids}")
+
+    since_load_ts = min(event.load_ts for event in events)
+    dbt_vars = latest_scope_vars(since_load_ts)
+    result = subprocess.run(["dbt", *dbt_args, "--vars", dbt_vars], cwd=project_dir, check=False)
+    if result.returncode != 0:
+        logger.error(f"dbt exited with code {result.returncode}")
+        return False
+
+    logger.info("Transforms complete")
+    return True
+
+
+def transform_loads(
+    event_groups: Iterable[list[LoadEvent]], dbt_args: list[str], project_dir: str
+) -> None:
+    """Run transforms for each group of load events.
+
+    Events from a failed dbt run are carried into the next run, so its test window
+    still starts at the earliest untested load.
+    """
+    pending: list[LoadEvent] = []
+    for events in event_groups:
+        pending = [*pending, *events]
+        if run_transforms(pending, dbt_args, project_dir):
+            pending = []
+        else:
+            logger.warning(f"Retrying {len(pending)} load events with the next load")
+
+
+def main():
+    """Listen for load events and run downstream dbt models on each one."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--project-dir", default="dbt", help="dbt project directory")
+    parser.add_argument("--profiles-dir", default=None, help="dbt profiles directory")
+    parser.add_argument("--target", default=None, help="dbt target")
+    parser.add_argument("--select", default=DEFAULT_DBT_SELECTOR, help="dbt node selector")
+    parser.add_argument("--debounce-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    dbt_args = ["build", "--select", args.select]
+    if args.profiles_dir:
+        dbt_args += ["--profiles-dir", args.profiles_dir]
+    if args.target:
+        dbt_args += ["--target", args.target]
+
+    try:
+        with XKCDLoader() as loader:
+            event_groups = listen_for_loads(loader.conn, debounce_seconds=args.debounce_seconds)
+            transform_loads(event_groups, dbt_args, args.project_dir)
+
+    except (RuntimeError, psycopg2.Error) as e:
+        logger.error(f"Listener failed: {e}", exc_info=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logger.info("Listener stopped")
+
+
+if __name__ == "__main__":
+    main()
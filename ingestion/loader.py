@@ -10,9 +10,12 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from ingestion.extractor import XKCDComic
+from ingestion.quality import RejectedComic, validate_batch
 
 logger = logging.getLogger(__name__)
 
+LOAD_NOTIFY_CHANNEL = "xkcd_comics_loaded"
+
 
 class DatabaseConfig(BaseSettings):
     """Database connection configuration."""
@@ -61,39 +64,93 @@ class XKCDLoader:
             self.conn = None
             logger.info("Database connection closed")
 
-    def load_comics(self, comics: list[XKCDComic], batch_size: int = 100) -> None:
-        """Load multiple comics in batches."""
+    def load_comics(self, comics: list[XKCDComic], batch_size: int = 100) -> int:
+        """Load multiple comics in batches, returning the number of comics loaded.
+
+        Comics failing validation are written to the quarantine table instead. Listeners
+        are notified after each committed batch that loaded at least one comic.
+        """
         if not self.conn:
             raise RuntimeError("Not connected to database")
 
         load_id = str(uuid.uuid4())
         load_ts = datetime.now(UTC)
+        loaded = 0
 
         for i in range(0, len(comics), batch_size):
-            batch = comics[i : i + batch_size]
-            batch_data = [
-                (
-                    comic.num,
-                    json.dumps(comic.model_dump()),
-                    load_ts,
-                    load_id,
-                )
-                for comic in batch
-            ]
+            valid, rejected = validate_batch(comics[i : i + batch_size])
 
             with self.conn.cursor() as cur:
-                cur.executemany(
-                    """
-                    insert into raw.xkcd_comics (comic_id, raw_json, load_ts, load_id)
-                    values (%s, %s, %s, %s)
-                    on conflict (comic_id) do update
-                    set raw_json = excluded.raw_json
-                    where raw.xkcd_comics.load_ts < excluded.load_ts
-                    """,
-                    batch_data,
-                )
+                if valid:
+                    self._insert_comics(cur, valid, load_id, load_ts)
+                if rejected:
+                    self._quarantine_comics(cur, rejected, load_id, load_ts)
+                if valid:
+                    # Delivered to LISTEN sessions only once the batch commits
+                    cur.execute(
+                        "select pg_notify(%s, %s)",
+                        (LOAD_NOTIFY_CHANNEL, self._load_event_payload(valid, load_id, load_ts)),
+                    )
                 self.conn.commit()
 
+            loaded += len(valid)
+
+        return loaded
+
+    @staticmethod
+    def _insert_comics(cur, comics: list[XKCDComic], load_id: str, load_ts: datetime) -> None:
+        """Upsert valid comics into the raw table and clear any earlier quarantine entries."""
+        cur.executemany(
+            """
+            insert into raw.xkcd_comics (comic_id, raw_json, load_ts, load_id)
+            values (%s, %s, %s, %s)
+            on conflict (comic_id) do update
+            set raw_json = excluded.raw_json
+            where raw.xkcd_comics.load_ts < excluded.load_ts
+            """,
+            [(comic.num, json.dumps(comic.model_dump()), load_ts, load_id) for comic in comics],
+        )
+        cur.execute(
+            "delete from raw.xkcd_comics_quarantine where comic_id = any(%s)",
+            ([comic.num for comic in comics],),
+        )
+
+    @staticmethod
+    def _quarantine_comics(
+        cur, rejected: list[RejectedComic], load_id: str, load_ts: datetime
+    ) -> None:
+        """Upsert rejected comics and their reasons into the quarantine table."""
+        logger.warning(f"Quarantined {len(rejected)} comics in load {load_id}")
+        cur.executemany(
+            """
+            insert into raw.xkcd_comics_quarantine (comic_id, raw_json, reasons, load_ts, load_id)
+            values (%s, %s, %s, %s, %s)
+            on conflict (comic_id) do update
+            set raw_json = excluded.raw_json,
+                reasons = excluded.reasons,
+                load_ts = excluded.load_ts,
+                load_id = excluded.load_id
+            """,
+            [
+                (r.comic.num, json.dumps(r.comic.model_dump()), r.reasons, load_ts, load_id)
+                for r in rejected
+            ],
+        )
+
+    @staticmethod
+    def _load_event_payload(batch: list[XKCDComic], load_id: str, load_ts: datetime) -> str:
+        """Build the NOTIFY payload describing a committed batch."""
+        comic_ids = [comic.num for comic in batch]
+        return json.dumps(
+            {
+                "load_id": load_id,
+                "load_ts": load_ts.isoformat(),
+                "min_comic_id": min(comic_ids),
+                "max_comic_id": max(comic_ids),
+                "comic_count": len(comic_ids),
+            }
+        )
+
     def get_existing_comic_ids(self) -> set[int]:
         """Get set of all comic IDs already in the database."""
         if not self.conn:
@@ -106,6 +163,17 @@ class XKCDLoader:
             logger.info(f"Found {len(comic_ids)} existing comics in database")
             return comic_ids
 
+    def get_quarantined_comic_ids(self) -> set[int]:
+        """Get set of comic IDs currently held back by the quality gate."""
+        if not self.conn:
+            raise RuntimeError("Not connected to database")
+
+        with self.conn.cursor() as cur:
+            cur.execute("select comic_id from raw.xkcd_comics_quarantine")
+            comic_ids = {row[0] for row in cur.fetchall()}
+            logger.info(f"Found {len(comic_ids)} quarantined comics in database")
+            return comic_ids
+
     def __enter__(self) -> "XKCDLoader":
         """Context manager entry."""
         self.connect()
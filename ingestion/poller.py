@@ -10,34 +10,39 @@ from ingestion.loader import XKCDLoader
 logger = logging.getLogger(__name__)
 
 
+def is_new_comic_available(extractor: XKCDExtractor, loader: XKCDLoader) -> bool:
+    """Compare the latest comic on the API with the latest comic in the database.
+
+    Quarantined comics count as seen: a newest comic that failed the quality gate
+    would otherwise trigger an ingestion run on every poke. Ingestion still retries
+    quarantined comics whenever it runs for a new one.
+    """
+    current_comic = extractor.fetch_current_comic()
+    if current_comic is None:
+        logger.warning("Could not fetch current comic from API")
+        return False
+
+    current_id = current_comic.num
+    logger.info(f"Current comic ID from API: {current_id}")
+
+    existing_ids = loader.get_existing_comic_ids() | loader.get_quarantined_comic_ids()
+    max_existing_id = max(existing_ids, default=0)
+    logger.info(f"Max existing comic ID in database: {max_existing_id}")
+
+    new_comic_available = current_id > max_existing_id
+    if new_comic_available:
+        logger.info(f"New comic available! Current: {current_id}, Max in DB: {max_existing_id}")
+    else:
+        logger.info(f"No new comic yet. Current: {current_id}, Max in DB: {max_existing_id}")
+
+    return new_comic_available
+
+
 def check_new_comic_available() -> bool:
     """Check if a new comic is available on XKCD API."""
     try:
-        with XKCDExtractor() as extractor:
-            current_comic = extractor.fetch_current_comic()
-            if current_comic is None:
-                logger.warning("Could not fetch current comic from API")
-                return False
-
-            current_id = current_comic.num
-            logger.info(f"Current comic ID from API: {current_id}")
-
-        with XKCDLoader() as loader:
-            existing_ids = loader.get_existing_comic_ids()
-            max_existing_id = max(existing_ids, default=0)
-            logger.info(f"Max existing comic ID in database: {max_existing_id}")
-
-            new_comic_available = current_id > max_existing_id
-            if new_comic_available:
-                logger.info(
-                    f"New comic available! Current: {current_id}, Max in DB: {max_existing_id}"
-                )
-            else:
-                logger.info(
-                    f"No new comic yet. Current: {current_id}, Max in DB: {max_existing_id}"
-                )
-
-            return new_comic_available
+        with XKCDExtractor() as extractor, XKCDLoader() as loader:
+            return is_new_comic_available(extractor, loader)
 
     except (RuntimeError, psycopg2.Error) as e:
         logger.error(f"Failed to check for new comic: {e}", exc_info=True)
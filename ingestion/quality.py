@@ -0,0 +1,80 @@
+"""Data Quality Gate - Validates batches of comics before they reach the raw layer."""
+
+import logging
+import re
+from datetime import date
+
+from pydantic import BaseModel
+
+from ingestion.extractor import XKCDComic
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_TEXT_FIELDS = ("title", "safe_title")
+URL_PATTERN = re.compile(r"^https?://[^\s/]+(/\S*)?$")
+
+
+class RejectedComic(BaseModel):
+    """Comic that failed validation, with the reasons it was rejected."""
+
+    comic: XKCDComic
+    reasons: list[str]
+
+
+def _invalid_dates(years: list[str], months: list[str], days: list[str]) -> list[bool]:
+    """Flag publication dates that are not numeric or not a real calendar date."""
+    flags = []
+    for year, month, day in zip(years, months, days, strict=True):
+        # int() also accepts non-ASCII digits such as "２０２５", which the staging
+        # model's ::integer casts reject
+        if not all(value.isascii() and value.isdigit() for value in (year, month, day)):
+            flags.append(True)
+            continue
+        try:
+            date(int(year), int(month), int(day))
+        except (TypeError, ValueError):
+            flags.append(True)
+        else:
+            flags.append(False)
+    return flags
+
+
+def _invalid_urls(urls: list[str]) -> list[bool]:
+    """Flag values that are not absolute http(s) URLs."""
+    return [URL_PATTERN.match(url) is None for url in urls]
+
+
+def _blank(values: list[str]) -> list[bool]:
+    """Flag empty or whitespace-only values."""
+    return [not value.strip() for value in values]
+
+
+def validate_batch(comics: list[XKCDComic]) -> tuple[list[XKCDComic], list[RejectedComic]]:
+    """Split a batch into valid comics and rejected comics.
+
+    Each check runs column-wise over the whole batch, so one bad comic only
+    costs its own row instead of failing the batch.
+    """
+    columns = {
+        field: [getattr(comic, field) for comic in comics]
+        for field in ("year", "month", "day", "img", *REQUIRED_TEXT_FIELDS)
+    }
+
+    checks = {
+        "invalid publish date": _invalid_dates(columns["year"], columns["month"], columns["day"]),
+        "invalid img url": _invalid_urls(columns["img"]),
+    }
+    for field in REQUIRED_TEXT_FIELDS:
+        checks[f"missing {field}"] = _blank(columns[field])
+
+    valid: list[XKCDComic] = []
+    rejected: list[RejectedComic] = []
+    for i, comic in enumerate(comics):
+        reasons = [reason for reason, flags in checks.items() if flags[i]]
+        if reasons:
+            logger.warning(f"Quarantining comic #{comic.num}: {', '.join(reasons)}")
+            rejected.append(RejectedComic(comic=comic, reasons=reasons))
+        else:
+            valid.append(comic)
+
+    return valid, rejected
@@ -12,27 +12,33 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Run incremental ingestion."""
-    logger.info("Starting XKCD ingestion")
+def ingest(extractor: XKCDExtractor, loader: XKCDLoader) -> int:
+    """Fetch and load all missing comics, returning the number of comics loaded."""
+    existing_ids = loader.get_existing_comic_ids()
 
-    try:
-        with XKCDExtractor() as extractor, XKCDLoader() as loader:
-            existing_ids = loader.get_existing_comic_ids()
+    comics = list(extractor.fetch_comics(existing_ids))
+
+    if not comics:
+        logger.info("No new comics - database is up to date")
+        return 0
 
-            comics = list(extractor.fetch_comics(existing_ids))
+    logger.info(f"Found {len(comics)} new comics to load")
 
-            if not comics:
-                logger.info("No new comics - database is up to date")
-                return
+    loaded = loader.load_comics(comics)
 
-            logger.info(f"Found {len(comics)} new comics to load")
+    logger.info(f"Ingestion complete: Successfully loaded {loaded} comics into database")
+    if loaded < len(comics):
+        logger.warning(f"{len(comics) - loaded} comics failed validation and were quarantined")
+    return loaded
 
-            loader.load_comics(comics)
 
-            logger.info(
-                f"Ingestion complete: Successfully loaded {len(comics)} comics into database"
-            )
+def main() -> int:
+    """Run incremental ingestion, returning the number of comics loaded."""
+    logger.info("Starting XKCD ingestion")
+
+    try:
+        with XKCDExtractor() as extractor, XKCDLoader() as loader:
+            return ingest(extractor, loader)
 
     except (RuntimeError, psycopg2.Error) as e:
         logger.error(f"Ingestion failed: {e}", exc_info=True)
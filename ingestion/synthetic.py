@@ -0,0 +1,164 @@
+"""Synthetic Data Generator - Bulk-fills the raw layer with fake comics for scale tests."""
+
+import argparse
+import calendar
+import csv
+import io
+import json
+import logging
+import random
+import sys
+import uuid
+from collections.abc import Generator
+from datetime import UTC, datetime
+
+import psycopg2
+
+from ingestion.extractor import XKCDComic
+from ingestion.loader import XKCDLoader
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Synthetic comics use negative IDs so they never collide with real comics,
+# are never fetched by the extractor and do not affect the poller's max ID
+SYNTHETIC_ID_CEILING = 0  # exclusive upper bound
+
+WORDS = (
+    "the a of to and in is it that for on with as was math graph science love physics "
+    "computer internet password python code bug server robot space rocket chart map "
+    "friend time sleep cat dog hat wiki standard protocol regex compiler keyboard "
+    "velociraptor nerd sniping kite bobby tables fiction theory sign"
+).split()
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    """Build a random sentence from the word list."""
+    return " ".join(rng.choices(WORDS, k=rng.randint(min_words, max_words)))
+
+
+def generate_comic(comic_id: int, rng: random.Random) -> XKCDComic:
+    """Generate one synthetic comic with plausible field shapes."""
+    year = rng.randint(2006, 2025)
+    month = rng.randint(1, 12)
+    day = rng.randint(1, calendar.monthrange(year, month)[1])
+    title = _sentence(rng, 1, 5).title()
+    slug = title.lower().replace(" ", "_")
+
+    return XKCDComic(
+        num=comic_id,
+        title=title,
+        safe_title=title,
+        alt=_sentence(rng, 5, 40),
+        img=f"https://imgs.xkcd.com/comics/{slug}.png",
+        transcript=_sentence(rng, 0, 200) if rng.random() < 0.6 else "",
+        year=str(year),
+        month=str(month),
+        day=str(day),
+        link="",
+        news="",
+    )
+
+
+def generate_chunks(
+    total_rows: int, chunk_size: int, seed: int, id_ceiling: int = SYNTHETIC_ID_CEILING
+) -> Generator[tuple[str, datetime, list[XKCDComic]], None, None]:
+    """Yield (load_id, load_ts, comics) chunks, one simulated load per chunk.
+
+    IDs count down from just below id_ceiling.
+    """
+    rng = random.Random(seed)
+    for start in range(0, total_rows, chunk_size):
+        stop = min(start + chunk_size, total_rows)
+        comics = [generate_comic(id_ceiling - n, rng) for n in range(start + 1, stop + 1)]
+        yield str(uuid.uuid4()), datetime.now(UTC), comics
+
+
+def _to_csv(comics: list[XKCDComic], load_id: str, load_ts: datetime) -> io.StringIO:
+    """Serialise a chunk as CSV for COPY."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for comic in comics:
+        writer.writerow([comic.num, json.dumps(comic.model_dump()), load_ts.isoformat(), load_id])
+    buffer.seek(0)
+    return buffer
+
+
+def _lowest_synthetic_id(conn: psycopg2.extensions.connection) -> int:
+    """Get the lowest synthetic ID already loaded, or the ceiling if there are none."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "select coalesce(min(comic_id), %s) from raw.xkcd_comics where comic_id < %s",
+            (SYNTHETIC_ID_CEILING, SYNTHETIC_ID_CEILING),
+        )
+        return cur.fetchone()[0]
+
+
+def clear_synthetic_comics(conn: psycopg2.extensions.connection) -> int:
+    """Delete all synthetic comics and their text features, returning the comics removed."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "delete from features.comic_text_features where comic_id < %s",
+            (SYNTHETIC_ID_CEILING,),
+        )
+        cur.execute(
+            "delete from raw.xkcd_comics where comic_id < %s",
+            (SYNTHETIC_ID_CEILING,),
+        )
+        deleted = cur.rowcount
+    conn.commit()
+    logger.info(f"Deleted {deleted} synthetic comics")
+    return deleted
+
+
+def load_synthetic_comics(
+    conn: psycopg2.extensions.connection,
+    total_rows: int,
+    chunk_size: int = 50000,
+    seed: int = 42,
+) -> int:
+    """Bulk-load synthetic comics with COPY, committing once per chunk.
+
+    New comics get IDs below any synthetic comics already loaded, so repeated runs
+    add rows instead of colliding on the primary key.
+    """
+    id_ceiling = _lowest_synthetic_id(conn)
+    loaded = 0
+    for load_id, load_ts, comics in generate_chunks(total_rows, chunk_size, seed, id_ceiling):
+        with conn.cursor() as cur:
+            cur.copy_expert(
+                "copy raw.xkcd_comics (comic_id, raw_json, load_ts, load_id) "
+                "from stdin with (format csv)",
+                _to_csv(comics, load_id, load_ts),
+            )
+        conn.commit()
+        loaded += len(comics)
+        logger.info(f"Loaded {loaded}/{total_rows} synthetic comics")
+    return loaded
+
+
+def main():
+    """Fill the raw layer with synthetic comics."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of comics to generate")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="rows per COPY / load_id")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clear", action="store_true", help="delete synthetic comics first")
+    parser.add_argument("--clear-only", action="store_true", help="only delete synthetic comics")
+    args = parser.parse_args()
+
+    try:
+        with XKCDLoader() as loader:
+            if args.clear or args.clear_only:
+                clear_synthetic_comics(loader.conn)
+            if args.clear_only:
+                return
+            load_synthetic_comics(loader.conn, args.rows, args.chunk_size, args.seed)
+
+    except (RuntimeError, psycopg2.Error) as e:
+        logger.error(f"Synthetic load failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Tests for ingestion client."""
+
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from ingestion.client import (
+    CHECK_TIMEOUT_SECONDS,
+    WorkerTimeoutError,
+    WorkerUnavailableError,
+    check_new_comic_available,
+    request_ingestion,
+    send_command,
+    worker_address,
+)
+
+
+@pytest.fixture
+def unused_address():
+    """Address with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()
+
+
+def test_worker_address_from_environment(monkeypatch):
+    """Test worker address is read from the environment."""
+    monkeypatch.setenv("INGESTION_WORKER_HOST", "ingestion-worker")
+    monkeypatch.setenv("INGESTION_WORKER_PORT", "9000")
+
+    assert worker_address() == ("ingestion-worker", 9000)
+
+
+def test_send_command_worker_unavailable(unused_address):
+    """Test an unreachable worker raises WorkerUnavailableError."""
+    with pytest.raises(WorkerUnavailableError):
+        send_command("ping", unused_address)
+
+
+def test_send_command_times_out_on_busy_worker():
+    """Test a worker that accepts but never answers raises WorkerTimeoutError."""
+    with socket.create_server(("localhost", 0)) as server:
+        with pytest.raises(WorkerTimeoutError):
+            send_command("check", server.getsockname()[:2], timeout=0.1)
+
+
+def test_send_command_unknown_command():
+    """Test unknown commands are rejected before connecting."""
+    with pytest.raises(ValueError, match="Unknown command"):
+        send_command("drop")
+
+
+def test_check_new_comic_available_falls_back_in_process():
+    """Test check runs in-process when the worker is unavailable."""
+    with (
+        patch("ingestion.client.send_command", side_effect=WorkerUnavailableError("down")),
+        patch("ingestion.poller.check_new_comic_available", return_value=True) as mock_check,
+    ):
+        assert check_new_comic_available() is True
+
+    mock_check.assert_called_once()
+
+
+def test_check_new_comic_available_worker_busy():
+    """Test a check that times out behind another request is reported as no new comic."""
+    with (
+        patch("ingestion.client.send_command", side_effect=WorkerTimeoutError("busy")) as mock_send,
+        patch("ingestion.poller.check_new_comic_available") as mock_check,
+    ):
+        assert check_new_comic_available() is False
+
+    mock_send.assert_called_once_with("check", timeout=CHECK_TIMEOUT_SECONDS)
+    mock_check.assert_not_called()
+
+
+def test_check_new_comic_available_worker_error():
+    """Test a failed check on the worker is reported as no new comic."""
+    with patch("ingestion.client.send_command", side_effect=RuntimeError("boom")):
+        assert check_new_comic_available() is False
+
+
+def test_request_ingestion_uses_worker():
+    """Test ingestion is delegated to the worker when it is available."""
+    with (
+        patch("ingestion.client.send_command", return_value=4) as mock_send,
+        patch("ingestion.run_ingestion.main") as mock_main,
+    ):
+        assert request_ingestion() == 4
+
+    mock_send.assert_called_once_with("ingest")
+    mock_main.assert_not_called()
+
+
+def test_request_ingestion_falls_back_in_process():
+    """Test ingestion runs in-process when the worker is unavailable."""
+    with (
+        patch("ingestion.client.send_command", side_effect=WorkerUnavailableError("down")),
+        patch("ingestion.run_ingestion.main", return_value=1) as mock_main,
+    ):
+        assert request_ingestion() == 1
+
+    mock_main.assert_called_once()
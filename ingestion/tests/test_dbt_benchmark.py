@@ -0,0 +1,77 @@
+"""Tests for dbt benchmark recorder."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ingestion.dbt_benchmark import find_regressions, parse_run_results, record_timings
+
+
+@pytest.fixture
+def run_results():
+    """Minimal run_results.json document."""
+    return {
+        "metadata": {
+            "invocation_id": "0b3c5f6e-8d0a-4a5e-9d36-0f5a9a1b2c3d",
+            "generated_at": "2025-01-01T12:00:00.000000Z",
+        },
+        "results": [
+            {
+                "unique_id": "model.xkcd_analytics.dim_comic",
+                "status": "success",
+                "execution_time": 1.25,
+            },
+            {
+                "unique_id": "test.xkcd_analytics.assert_cost_calculation",
+                "status": "pass",
+                "execution_time": 0.5,
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def mock_connection():
+    """Mock database connection and cursor."""
+    mock_conn = Mock()
+    mock_cursor = Mock()
+    mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+    mock_conn.cursor.return_value.__exit__ = Mock(return_value=None)
+    return mock_conn, mock_cursor
+
+
+def test_parse_run_results(run_results):
+    """Test node timings are extracted with their resource type."""
+    timings = parse_run_results(run_results)
+
+    assert [t.resource_type for t in timings] == ["model", "test"]
+    assert [t.execution_time_s for t in timings] == [1.25, 0.5]
+    assert {t.invocation_id for t in timings} == {"0b3c5f6e-8d0a-4a5e-9d36-0f5a9a1b2c3d"}
+
+
+def test_record_timings(run_results, mock_connection):
+    """Test timings are written in one statement with the raw row count."""
+    mock_conn, mock_cursor = mock_connection
+    timings = parse_run_results(run_results)
+
+    with patch("ingestion.dbt_benchmark.execute_values") as mock_execute_values:
+        record_timings(mock_conn, timings, raw_row_count=1_000_000)
+
+    rows = mock_execute_values.call_args.args[2]
+    assert len(rows) == 2
+    assert all(row[2] == 1_000_000 for row in rows)
+    mock_conn.commit.assert_called_once()
+
+
+def test_find_regressions(mock_connection):
+    """Test regressions are returned from the history query."""
+    mock_conn, mock_cursor = mock_connection
+    mock_cursor.fetchall.return_value = [("model.xkcd_analytics.dim_comic", 1.0, 3.0)]
+
+    regressions = find_regressions(mock_conn, "abc", threshold=2.0)
+
+    assert regressions == [("model.xkcd_analytics.dim_comic", 1.0, 3.0)]
+    query, params = mock_cursor.execute.call_args.args
+    assert params == {"invocation_id": "abc", "threshold": 2.0}
+    # Baselines are matched per order of magnitude, not on the exact row count
+    assert "round(log(greatest(history.raw_row_count, 1)))" in query
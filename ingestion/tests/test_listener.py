@@ -0,0 +1,139 @@
+"""Tests for load listener."""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from ingestion.listener import LoadEvent, listen_for_loads, run_transforms, transform_loads
+
+
+def make_notify(
+    comic_ids,
+    load_id="11111111-1111-1111-1111-111111111111",
+    load_ts="2025-01-01T12:00:00+00:00",
+):
+    """Build a notification as emitted by the loader."""
+    payload = json.dumps(
+        {
+            "load_id": load_id,
+            "load_ts": load_ts,
+            "min_comic_id": min(comic_ids),
+            "max_comic_id": max(comic_ids),
+            "comic_count": len(comic_ids),
+        }
+    )
+    return Mock(payload=payload)
+
+
+@pytest.fixture
+def mock_connection():
+    """Mock database connection that can receive notifications."""
+    mock_conn = MagicMock()
+    mock_conn.notifies = []
+    return mock_conn
+
+
+def test_listen_for_loads_groups_batches(mock_connection):
+    """Test batches arriving within the debounce window are yielded together."""
+    pending = [[make_notify([1, 2])], [make_notify([3])]]
+
+    def poll():
+        if pending:
+            mock_connection.notifies.extend(pending.pop(0))
+
+    mock_connection.poll.side_effect = poll
+    ready = ([mock_connection], [], [])
+    with patch("ingestion.listener.select.select", side_effect=[ready, ready, ([], [], [])]):
+        events = next(listen_for_loads(mock_connection, debounce_seconds=0.1))
+
+    assert [(e.min_comic_id, e.max_comic_id) for e in events] == [(1, 2), (3, 3)]
+    assert mock_connection.autocommit is True
+    mock_connection.cursor.return_value.__enter__.return_value.execute.assert_called_once_with(
+        "listen xkcd_comics_loaded"
+    )
+
+
+def test_listen_for_loads_skips_malformed_payload(mock_connection):
+    """Test malformed notifications are ignored."""
+    pending = [[Mock(payload="not json"), make_notify([7])]]
+
+    def poll():
+        if pending:
+            mock_connection.notifies.extend(pending.pop(0))
+
+    mock_connection.poll.side_effect = poll
+    ready = ([mock_connection], [], [])
+    with patch("ingestion.listener.select.select", side_effect=[ready, ([], [], [])]):
+        events = next(listen_for_loads(mock_connection))
+
+    assert len(events) == 1
+    assert events[0].max_comic_id == 7
+
+
+def test_run_transforms_invokes_dbt():
+    """Test run_transforms runs dbt in the project directory."""
+    event = LoadEvent.model_validate_json(make_notify([1]).payload)
+
+    with patch("ingestion.listener.subprocess.run") as mock_run:
+        mock_run.return_value.returncode = 0
+        assert run_transforms([event], ["build", "--select", "x+"], "dbt") is True
+
+    mock_run.assert_called_once_with(
+        [
+            "dbt",
+            "build",
+            "--select",
+            "x+",
+            "--vars",
+            '{"test_scope": "latest", "since_load_ts": "2025-01-01T12:00:00+00:00"}',
+        ],
+        cwd="dbt",
+        check=False,
+    )
+
+
+def test_run_transforms_tests_every_load_in_batch():
+    """Test tests are scoped from the earliest load in the batch, not only the newest."""
+    events = [
+        LoadEvent.model_validate_json(make_notify([2], "b", "2025-01-01T12:05:00+00:00").payload),
+        LoadEvent.model_validate_json(make_notify([1], "a", "2025-01-01T12:00:00+00:00").payload),
+    ]
+
+    with patch("ingestion.listener.subprocess.run") as mock_run:
+        mock_run.return_value.returncode = 0
+        run_transforms(events, ["build"], "dbt")
+
+    dbt_vars = json.loads(mock_run.call_args.args[0][-1])
+    assert dbt_vars == {"test_scope": "latest", "since_load_ts": "2025-01-01T12:00:00+00:00"}
+
+
+def test_run_transforms_reports_failure():
+    """Test run_transforms returns False when dbt fails."""
+    event = LoadEvent.model_validate_json(make_notify([1]).payload)
+
+    with patch("ingestion.listener.subprocess.run") as mock_run:
+        mock_run.return_value.returncode = 1
+        assert run_transforms([event], ["build"], "dbt") is False
+
+
+def test_transform_loads_carries_failed_events_forward():
+    """Test loads from a failed dbt run are included in the next run's test window."""
+    failed = LoadEvent.model_validate_json(
+        make_notify([1], "a", "2025-01-01T12:00:00+00:00").payload
+    )
+    later = LoadEvent.model_validate_json(
+        make_notify([2], "b", "2025-01-01T13:00:00+00:00").payload
+    )
+    latest = LoadEvent.model_validate_json(
+        make_notify([3], "c", "2025-01-01T14:00:00+00:00").payload
+    )
+
+    with patch("ingestion.listener.run_transforms", side_effect=[False, True, True]) as mock_run:
+        transform_loads([[failed], [later], [latest]], ["build"], "dbt")
+
+    assert [call.args[0] for call in mock_run.call_args_list] == [
+        [failed],
+        [failed, later],
+        [latest],
+    ]
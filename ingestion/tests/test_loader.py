@@ -1,11 +1,12 @@
 """Tests for XKCD loader."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
 
 from ingestion.extractor import XKCDComic
-from ingestion.loader import DatabaseConfig, XKCDLoader
+from ingestion.loader import LOAD_NOTIFY_CHANNEL, DatabaseConfig, XKCDLoader
 
 
 @pytest.fixture
@@ -80,7 +81,7 @@ def test_load_comics_single_batch(mock_config, sample_comic, mock_connection):
     loader.conn = mock_conn
 
     comics = [sample_comic]
-    loader.load_comics(comics)
+    assert loader.load_comics(comics) == 1
 
     mock_cursor.executemany.assert_called_once()
     mock_conn.commit.assert_called_once()
@@ -99,6 +100,62 @@ def test_load_comics_multiple_batches(mock_config, sample_comic, mock_connection
     assert mock_conn.commit.call_count == 3
 
 
+def test_load_comics_notifies_per_batch(mock_config, sample_comic, mock_connection):
+    """Test load_comics emits a load event with the batch ID range for each batch."""
+    loader = XKCDLoader(config=mock_config)
+    mock_conn, mock_cursor = mock_connection
+    loader.conn = mock_conn
+
+    comics = [sample_comic.model_copy(update={"num": num}) for num in range(1, 151)]
+    loader.load_comics(comics, batch_size=100)
+
+    notify_calls = [
+        call for call in mock_cursor.execute.call_args_list if "pg_notify" in call.args[0]
+    ]
+    assert len(notify_calls) == 2
+    payloads = []
+    for call in notify_calls:
+        channel, payload = call.args[1]
+        assert channel == LOAD_NOTIFY_CHANNEL
+        payloads.append(json.loads(payload))
+
+    assert [(p["min_comic_id"], p["max_comic_id"]) for p in payloads] == [(1, 100), (101, 150)]
+    assert [p["comic_count"] for p in payloads] == [100, 50]
+    assert payloads[0]["load_id"] == payloads[1]["load_id"]
+
+
+def test_load_comics_quarantines_invalid_comics(mock_config, sample_comic, mock_connection):
+    """Test invalid comics go to the quarantine table and valid ones still load."""
+    loader = XKCDLoader(config=mock_config)
+    mock_conn, mock_cursor = mock_connection
+    loader.conn = mock_conn
+
+    bad_comic = sample_comic.model_copy(update={"num": 2, "month": "Jan"})
+    loaded = loader.load_comics([sample_comic, bad_comic])
+
+    assert loaded == 1
+    raw_call, quarantine_call = mock_cursor.executemany.call_args_list
+    assert "raw.xkcd_comics " in raw_call.args[0]
+    assert [row[0] for row in raw_call.args[1]] == [1]
+    assert "raw.xkcd_comics_quarantine" in quarantine_call.args[0]
+    assert [(row[0], row[2]) for row in quarantine_call.args[1]] == [(2, ["invalid publish date"])]
+    mock_conn.commit.assert_called_once()
+
+
+def test_load_comics_all_invalid_skips_notify(mock_config, sample_comic, mock_connection):
+    """Test a batch with no valid comics is quarantined without a load event."""
+    loader = XKCDLoader(config=mock_config)
+    mock_conn, mock_cursor = mock_connection
+    loader.conn = mock_conn
+
+    bad_comic = sample_comic.model_copy(update={"title": " "})
+
+    assert loader.load_comics([bad_comic]) == 0
+    mock_cursor.executemany.assert_called_once()
+    mock_cursor.execute.assert_not_called()
+    mock_conn.commit.assert_called_once()
+
+
 def test_get_existing_comic_ids_not_connected(mock_config):
     """Test get_existing_comic_ids raises RuntimeError when not connected."""
     loader = XKCDLoader(config=mock_config)
@@ -118,3 +175,16 @@ def test_get_existing_comic_ids(mock_config, mock_connection):
 
     assert comic_ids == {1, 2, 3}
     mock_cursor.execute.assert_called_once_with("select comic_id from raw.xkcd_comics")
+
+
+def test_get_quarantined_comic_ids(mock_config, mock_connection):
+    """Test get_quarantined_comic_ids returns set of quarantined comic IDs."""
+    loader = XKCDLoader(config=mock_config)
+    mock_conn, mock_cursor = mock_connection
+    mock_cursor.fetchall.return_value = [(4,)]
+    loader.conn = mock_conn
+
+    comic_ids = loader.get_quarantined_comic_ids()
+
+    assert comic_ids == {4}
+    mock_cursor.execute.assert_called_once_with("select comic_id from raw.xkcd_comics_quarantine")
@@ -0,0 +1,66 @@
+"""Tests for lazy imports of the ingestion package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ingestion
+
+HEAVY_MODULES = ("requests", "pydantic", "psycopg2", "tenacity")
+
+
+def imported_heavy_modules(statement: str) -> list[str]:
+    """Run a statement in a fresh interpreter and list the heavy modules it imported."""
+    script = (
+        f"import sys; {statement}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import ingestion",
+        "import ingestion.client",
+        "from ingestion import request_ingestion, check_new_comic_available",
+    ],
+)
+def test_thin_entry_points_do_not_import_heavy_dependencies(statement):
+    """Test the package and client entry points stay standard library only."""
+    assert imported_heavy_modules(statement) == []
+
+
+def test_heavy_entry_points_load_on_access():
+    """Test accessing a heavy entry point imports its dependencies."""
+    assert "psycopg2" in imported_heavy_modules("from ingestion import XKCDLoader")
+
+
+def test_lazy_attribute_resolves_to_module_object():
+    """Test lazy attributes are the same objects as in their modules."""
+    from ingestion.loader import XKCDLoader
+
+    assert ingestion.XKCDLoader is XKCDLoader
+    assert "XKCDLoader" in dir(ingestion)
+
+
+def test_lazy_attribute_not_shadowed_by_submodule():
+    """Test importing ingestion.run_ingestion does not change the client entry point."""
+    script = (
+        "import ingestion.run_ingestion; "
+        "from ingestion import request_ingestion; "
+        "import ingestion.client; "
+        "assert request_ingestion is ingestion.client.request_ingestion; "
+        "assert callable(ingestion.run_ingestion.main)"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_unknown_attribute_raises():
+    """Test unknown attributes raise AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        ingestion.missing
@@ -22,6 +22,7 @@ def mock_loader():
     """Mock XKCDLoader."""
     with patch("ingestion.poller.XKCDLoader") as mock:
         loader_instance = MagicMock()
+        loader_instance.get_quarantined_comic_ids.return_value = set()
         mock.return_value.__enter__.return_value = loader_instance
         mock.return_value.__exit__.return_value = None
         yield loader_instance
@@ -75,6 +76,30 @@ def test_check_new_comic_available_when_no_new_comic(mock_extractor, mock_loader
     mock_loader.get_existing_comic_ids.assert_called_once()
 
 
+def test_check_new_comic_available_ignores_quarantined_comic(mock_extractor, mock_loader):
+    """Test a newest comic held in quarantine is not reported as new again."""
+    from ingestion.extractor import XKCDComic
+
+    current_comic = XKCDComic(
+        num=51,
+        title="",
+        safe_title="",
+        alt="Alt text",
+        img="https://example.com/img.png",
+        year="2025",
+        month="1",
+        day="1",
+    )
+    mock_extractor.fetch_current_comic.return_value = current_comic
+    mock_loader.get_existing_comic_ids.return_value = {1, 2, 3, 50}
+    mock_loader.get_quarantined_comic_ids.return_value = {51}
+
+    result = check_new_comic_available()
+
+    assert result is False
+    mock_loader.get_quarantined_comic_ids.assert_called_once()
+
+
 def test_check_new_comic_available_when_no_comics_in_db(mock_extractor, mock_loader):
     """Test that check_new_comic_available returns True when database is empty."""
     from ingestion.extractor import XKCDComic
@@ -0,0 +1,73 @@
+"""Tests for data quality gate."""
+
+import pytest
+
+from ingestion.extractor import XKCDComic
+from ingestion.quality import validate_batch
+
+
+@pytest.fixture
+def sample_comic():
+    """Sample comic for testing."""
+    return XKCDComic(
+        num=1,
+        title="Test Comic",
+        safe_title="test_comic",
+        alt="Test alt text",
+        img="https://example.com/comic.png",
+        transcript="Test transcript",
+        year="2025",
+        month="1",
+        day="1",
+        link="",
+        news="",
+    )
+
+
+def test_validate_batch_all_valid(sample_comic):
+    """Test a clean batch passes through unchanged."""
+    comics = [sample_comic.model_copy(update={"num": num}) for num in range(1, 4)]
+
+    valid, rejected = validate_batch(comics)
+
+    assert valid == comics
+    assert rejected == []
+
+
+@pytest.mark.parametrize(
+    ("update", "reason"),
+    [
+        ({"year": "20x5"}, "invalid publish date"),
+        ({"year": "２０２５"}, "invalid publish date"),
+        ({"month": "13"}, "invalid publish date"),
+        ({"day": "30", "month": "2"}, "invalid publish date"),
+        ({"img": "comic.png"}, "invalid img url"),
+        ({"img": "ftp://example.com/comic.png"}, "invalid img url"),
+        ({"title": ""}, "missing title"),
+        ({"safe_title": "  "}, "missing safe_title"),
+    ],
+)
+def test_validate_batch_rejects_invalid_comic(sample_comic, update, reason):
+    """Test each check rejects only the failing comic with its reason."""
+    bad_comic = sample_comic.model_copy(update={"num": 2, **update})
+
+    valid, rejected = validate_batch([sample_comic, bad_comic])
+
+    assert valid == [sample_comic]
+    assert len(rejected) == 1
+    assert rejected[0].comic == bad_comic
+    assert rejected[0].reasons == [reason]
+
+
+def test_validate_batch_collects_all_reasons(sample_comic):
+    """Test a comic failing several checks reports every reason."""
+    bad_comic = sample_comic.model_copy(update={"day": "", "img": "", "title": ""})
+
+    _, rejected = validate_batch([bad_comic])
+
+    assert rejected[0].reasons == ["invalid publish date", "invalid img url", "missing title"]
+
+
+def test_validate_batch_empty():
+    """Test an empty batch is handled."""
+    assert validate_batch([]) == ([], [])
@@ -44,7 +44,7 @@ def test_main_no_new_comics(sample_comic):
 
         from ingestion.run_ingestion import main
 
-        main()
+        assert main() == 0
 
         mock_loader.get_existing_comic_ids.assert_called_once()
         mock_extractor.fetch_comics.assert_called_once_with({1, 2, 3})
@@ -66,10 +66,11 @@ def test_main_with_new_comics(sample_comic):
 
         mock_loader.get_existing_comic_ids.return_value = {1, 2}
         mock_extractor.fetch_comics.return_value = [sample_comic]
+        mock_loader.load_comics.return_value = 1
 
         from ingestion.run_ingestion import main
 
-        main()
+        assert main() == 1
 
         mock_loader.get_existing_comic_ids.assert_called_once()
         mock_extractor.fetch_comics.assert_called_once_with({1, 2})
@@ -0,0 +1,91 @@
+"""Tests for synthetic data generator."""
+
+import csv
+import json
+import random
+from datetime import date
+from unittest.mock import Mock
+
+from ingestion.synthetic import (
+    _to_csv,
+    clear_synthetic_comics,
+    generate_chunks,
+    generate_comic,
+    load_synthetic_comics,
+)
+
+
+def test_generate_comic_has_valid_date():
+    """Test generated comics always have a parseable publish date."""
+    rng = random.Random(0)
+    for comic_id in range(-1, -200, -1):
+        comic = generate_comic(comic_id, rng)
+        assert date(int(comic.year), int(comic.month), int(comic.day))
+        assert comic.title
+        assert comic.img.startswith("https://")
+
+
+def test_generate_chunks_uses_negative_ids():
+    """Test chunks cover the requested rows with unique negative IDs and one load_id each."""
+    chunks = list(generate_chunks(total_rows=25, chunk_size=10, seed=1))
+
+    assert [len(comics) for _, _, comics in chunks] == [10, 10, 5]
+    ids = [comic.num for _, _, comics in chunks for comic in comics]
+    assert ids == list(range(-1, -26, -1))
+    assert len({load_id for load_id, _, _ in chunks}) == 3
+
+
+def test_generate_chunks_starts_below_ceiling():
+    """Test IDs continue below existing synthetic comics."""
+    chunks = list(generate_chunks(total_rows=3, chunk_size=10, seed=1, id_ceiling=-100))
+
+    assert [comic.num for comic in chunks[0][2]] == [-101, -102, -103]
+
+
+def test_generate_chunks_is_deterministic():
+    """Test the same seed produces the same comics."""
+    first = [c.title for _, _, comics in generate_chunks(5, 5, seed=7) for c in comics]
+    second = [c.title for _, _, comics in generate_chunks(5, 5, seed=7) for c in comics]
+    assert first == second
+
+
+def test_to_csv_round_trips_json():
+    """Test CSV rows carry JSON that matches the comic model."""
+    _, load_ts, comics = next(generate_chunks(2, 2, seed=3))
+    rows = list(csv.reader(_to_csv(comics, "load-1", load_ts)))
+
+    assert len(rows) == 2
+    assert int(rows[0][0]) == comics[0].num
+    assert json.loads(rows[0][1]) == comics[0].model_dump()
+    assert rows[0][3] == "load-1"
+
+
+def test_load_synthetic_comics_copies_each_chunk():
+    """Test each chunk is copied and committed separately."""
+    mock_conn = Mock()
+    mock_cursor = Mock()
+    mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+    mock_conn.cursor.return_value.__exit__ = Mock(return_value=None)
+    mock_cursor.fetchone.return_value = (-10,)
+
+    loaded = load_synthetic_comics(mock_conn, total_rows=30, chunk_size=20)
+
+    assert loaded == 30
+    assert mock_cursor.copy_expert.call_count == 2
+    assert mock_conn.commit.call_count == 2
+    first_chunk = mock_cursor.copy_expert.call_args_list[0].args[1]
+    assert next(csv.reader(first_chunk))[0] == "-11"
+
+
+def test_clear_synthetic_comics_only_deletes_negative_ids():
+    """Test clearing targets synthetic IDs only, including their text features."""
+    mock_conn = Mock()
+    mock_cursor = Mock(rowcount=4)
+    mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+    mock_conn.cursor.return_value.__exit__ = Mock(return_value=None)
+
+    assert clear_synthetic_comics(mock_conn) == 4
+    assert [call.args for call in mock_cursor.execute.call_args_list] == [
+        ("delete from features.comic_text_features where comic_id < %s", (0,)),
+        ("delete from raw.xkcd_comics where comic_id < %s", (0,)),
+    ]
@@ -0,0 +1,95 @@
+"""Tests for text feature stage."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from ingestion.text_features import (
+    FEATURE_COLUMNS,
+    compute_text_features,
+    process_new_comics,
+    vocabulary_stats,
+    word_counts,
+)
+
+
+def test_word_counts():
+    """Test words are counted on any run of whitespace."""
+    texts = ["", "  hello   world ", "a\tb\nc", "one", "[[A man]]\n{{Title: x}}"]
+
+    assert word_counts(texts).tolist() == [0, 2, 3, 1, 4]
+
+
+def test_word_counts_empty():
+    """Test an empty chunk returns an empty array."""
+    assert word_counts([]).tolist() == []
+
+
+def test_vocabulary_stats():
+    """Test distinct tokens, diversity and mean token length per text."""
+    vocabulary_size, lexical_diversity, avg_word_length = vocabulary_stats(
+        ["", "It's a TEST, it's", "cat cat dog"]
+    )
+
+    assert vocabulary_size.tolist() == [0, 3, 2]
+    assert lexical_diversity.tolist() == pytest.approx([0.0, 0.75, 2 / 3])
+    assert avg_word_length.tolist() == pytest.approx([0.0, 3.25, 3.0])
+
+
+def test_vocabulary_stats_no_tokens():
+    """Test texts without tokens produce zeros."""
+    vocabulary_size, lexical_diversity, avg_word_length = vocabulary_stats(["", "..."])
+
+    assert vocabulary_size.tolist() == [0, 0]
+    assert lexical_diversity.tolist() == [0.0, 0.0]
+    assert avg_word_length.tolist() == [0.0, 0.0]
+
+
+def test_compute_text_features():
+    """Test every feature column is computed for each comic."""
+    features = compute_text_features(
+        titles=["Barrel - Part 1", "Petit Trees"],
+        alts=["Don't we all.", ""],
+        transcripts=["", "[[Trees]]"],
+    )
+
+    assert set(features) == set(FEATURE_COLUMNS)
+    assert features["title_word_count"].tolist() == [4, 2]
+    assert features["alt_char_length"].tolist() == [13, 0]
+    assert features["transcript_word_count"].tolist() == [0, 1]
+    np.testing.assert_allclose(features["reading_time_seconds"], [7 * 60 / 200, 3 * 60 / 200])
+
+
+def test_process_new_comics_writes_each_chunk():
+    """Test new comics are processed in chunks, committing after each."""
+    mock_conn = MagicMock()
+    mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cursor.fetchmany.side_effect = [
+        [(1, "load-1", "A title", "alt", ""), (2, "load-1", "B", "", "x y")],
+        [(3, "load-2", "C", "alt text", "")],
+        [],
+    ]
+
+    with patch("ingestion.text_features.execute_values") as mock_execute_values:
+        processed = process_new_comics(mock_conn, chunk_size=2)
+
+    assert processed == 3
+    assert mock_execute_values.call_count == 2
+    first_rows = mock_execute_values.call_args_list[0].args[2]
+    assert [row[:3] for row in first_rows] == [(1, "load-1", 2), (2, "load-1", 1)]
+    assert mock_conn.commit.call_count == 3
+    mock_cursor.execute.assert_called_once()
+    assert mock_cursor.execute.call_args.args[1] == {"load_id": None, "since_load_ts": None}
+
+
+def test_process_new_comics_filters_on_load_window():
+    """Test the new comics query is restricted to loads at or after since_load_ts."""
+    mock_conn = MagicMock()
+    mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cursor.fetchmany.return_value = []
+
+    assert process_new_comics(mock_conn, since_load_ts="2025-01-01T12:00:00+00:00") == 0
+
+    params = mock_cursor.execute.call_args.args[1]
+    assert params["since_load_ts"] == "2025-01-01T12:00:00+00:00"
@@ -0,0 +1,98 @@
+"""Tests for ingestion worker."""
+
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from ingestion.client import send_command
+from ingestion.worker import IngestionWorker, WorkerServer, _RequestHandler
+
+
+@pytest.fixture
+def mock_loader():
+    """Mock XKCDLoader with an open connection."""
+    loader = MagicMock()
+    loader.conn.closed = 0
+    return loader
+
+
+@pytest.fixture
+def worker(mock_loader):
+    """Worker with mocked extractor and loader."""
+    return IngestionWorker(extractor=MagicMock(), loader=mock_loader)
+
+
+def test_handle_ping(worker):
+    """Test ping succeeds without touching the database."""
+    assert worker.handle("ping") == {"ok": True, "result": True}
+    worker.loader.connect.assert_not_called()
+
+
+def test_handle_check_reuses_connection(worker, mock_loader):
+    """Test check runs against the existing connection and ends the transaction."""
+    with patch("ingestion.worker.is_new_comic_available", return_value=True) as mock_check:
+        assert worker.handle("check") == {"ok": True, "result": True}
+        assert worker.handle("check") == {"ok": True, "result": True}
+
+    assert mock_check.call_count == 2
+    mock_loader.connect.assert_not_called()
+    assert mock_loader.conn.rollback.call_count == 2
+
+
+def test_handle_ingest_reconnects_closed_connection(worker, mock_loader):
+    """Test a dropped connection is replaced before running a command."""
+    mock_loader.conn.closed = 1
+
+    with patch("ingestion.worker.ingest", return_value=3):
+        response = worker.handle("ingest")
+
+    assert response == {"ok": True, "result": 3}
+    mock_loader.connect.assert_called_once()
+
+
+def test_handle_database_error_disconnects(worker, mock_loader):
+    """Test database errors are reported and force a fresh connection next time."""
+    with patch("ingestion.worker.ingest", side_effect=psycopg2.OperationalError("gone")):
+        response = worker.handle("ingest")
+
+    assert response == {"ok": False, "error": "gone"}
+    mock_loader.disconnect.assert_called_once()
+
+
+def test_handle_unknown_command(worker):
+    """Test unknown commands are rejected."""
+    assert worker.handle("drop") == {"ok": False, "error": "Unknown command: drop"}
+
+
+def test_server_round_trip(worker):
+    """Test the client can run commands against a live server."""
+    with WorkerServer(("localhost", 0), worker) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with patch("ingestion.worker.ingest", return_value=2):
+                assert send_command("ping", server.server_address) is True
+                assert send_command("ingest", server.server_address) == 2
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_server_drops_idle_connection(worker):
+    """Test a client that connects and sends nothing does not block later requests."""
+    with (
+        patch.object(_RequestHandler, "timeout", 0.2),
+        WorkerServer(("localhost", 0), worker) as server,
+    ):
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.create_connection(server.server_address) as idle:
+                assert send_command("ping", server.server_address, timeout=3) is True
+                assert b"Malformed request" in idle.recv(1024)
+        finally:
+            server.shutdown()
+            thread.join()
@@ -0,0 +1,331 @@
+"""Text Feature Stage - Computes text metrics for new comics with vectorised NumPy operations."""
+
+import argparse
+import logging
+import re
+import sys
+import time
+from itertools import chain
+
+import numpy as np
+import psycopg2
+from psycopg2.extras import execute_values
+
+from ingestion.loader import XKCDLoader
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WORDS_PER_MINUTE = 200
+WHITESPACE_CODEPOINTS = np.array([ord(c) for c in " \t\n\r\x0b\x0c"], dtype=np.uint32)
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+FEATURE_COLUMNS = (
+    "title_word_count",
+    "alt_word_count",
+    "alt_char_length",
+    "transcript_word_count",
+    "transcript_char_length",
+    "reading_time_seconds",
+    "vocabulary_size",
+    "lexical_diversity",
+    "avg_word_length",
+)
+
+NEW_COMICS_QUERY = """
+    select
+        raw.comic_id,
+        raw.load_id,
+        coalesce(raw.raw_json ->> 'title', ''),
+        coalesce(raw.raw_json ->> 'alt', ''),
+        coalesce(raw.raw_json ->> 'transcript', '')
+    from raw.xkcd_comics as raw
+    where not exists (
+        select 1
+        from features.comic_text_features as features
+        where features.comic_id = raw.comic_id
+    )
+    and (%(load_id)s::uuid is null or raw.load_id = %(load_id)s::uuid)
+    -- Cast to timestamp (as load_ts is) so idx_xkcd_comics_load_ts can be used
+    and (
+        %(since_load_ts)s::timestamptz is null
+        or raw.load_ts >= %(since_load_ts)s::timestamptz::timestamp
+    )
+    order by raw.comic_id
+"""
+
+# Per-row SQL equivalent of compute_text_features, used by the benchmark
+SQL_FEATURES_QUERY = """
+    with parsed as (
+        select
+            comic_id,
+            coalesce(raw_json ->> 'title', '') as title,
+            coalesce(raw_json ->> 'alt', '') as alt,
+            coalesce(raw_json ->> 'transcript', '') as transcript
+        from raw.xkcd_comics
+        order by comic_id
+        limit %(limit)s
+    ),
+
+    stripped as (
+        select
+            comic_id,
+            alt,
+            transcript,
+            nullif(btrim(title, E' \\t\\n\\r\\013\\f'), '') as title_words,
+            nullif(btrim(alt, E' \\t\\n\\r\\013\\f'), '') as alt_words,
+            nullif(btrim(transcript, E' \\t\\n\\r\\013\\f'), '') as transcript_words,
+            lower(title || ' ' || alt || ' ' || transcript) as all_text
+        from parsed
+    ),
+
+    counted as (
+        select
+            comic_id,
+            coalesce(
+                array_length(regexp_split_to_array(title_words, '\\s+'), 1), 0
+            ) as title_word_count,
+            coalesce(
+                array_length(regexp_split_to_array(alt_words, '\\s+'), 1), 0
+            ) as alt_word_count,
+            char_length(alt) as alt_char_length,
+            coalesce(
+                array_length(regexp_split_to_array(transcript_words, '\\s+'), 1), 0
+            ) as transcript_word_count,
+            char_length(transcript) as transcript_char_length,
+            array(
+                select token[1]
+                from regexp_matches(all_text, '[a-z0-9'']+', 'g') as token
+            ) as tokens
+        from stripped
+    )
+
+    select
+        comic_id,
+        title_word_count,
+        alt_word_count,
+        alt_char_length,
+        transcript_word_count,
+        transcript_char_length,
+        (title_word_count + alt_word_count + transcript_word_count) * 60.0 / %(wpm)s
+            as reading_time_seconds,
+        (select count(distinct t) from unnest(tokens) as t) as vocabulary_size,
+        coalesce(
+            (select count(distinct t) from unnest(tokens) as t)::float
+            / nullif(cardinality(tokens), 0),
+            0
+        ) as lexical_diversity,
+        coalesce((select avg(char_length(t)) from unnest(tokens) as t), 0) as avg_word_length
+    from counted
+"""
+
+
+def text_lengths(texts: list[str]) -> np.ndarray:
+    """Character length of each text."""
+    return np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+
+
+def word_counts(texts: list[str]) -> np.ndarray:
+    """Count whitespace-separated words in each text.
+
+    All texts are packed into one code point array, each followed by a newline, so
+    word starts (a non-space preceded by a space) are found in a single pass and
+    summed per text with reduceat.
+    """
+    if not texts:
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = text_lengths(texts)
+    packed = ("\n".join(texts) + "\n").encode("utf-32-le", errors="surrogatepass")
+    codepoints = np.frombuffer(packed, dtype=np.uint32)
+    is_space = np.isin(codepoints, WHITESPACE_CODEPOINTS)
+
+    word_start = ~is_space
+    word_start[1:] &= is_space[:-1]
+
+    offsets = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    return np.add.reduceat(word_start.astype(np.int64), offsets)
+
+
+def vocabulary_stats(texts: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Distinct token count, distinct/total token ratio and mean token length per text."""
+    n = len(texts)
+    token_lists = [TOKEN_PATTERN.findall(text.lower()) for text in texts]
+    token_counts = np.fromiter(map(len, token_lists), dtype=np.int64, count=n)
+    if not token_counts.any():
+        return np.zeros(n, dtype=np.int64), np.zeros(n), np.zeros(n)
+
+    total = int(token_counts.sum())
+    doc_index = np.repeat(np.arange(n), token_counts)
+
+    # Integer token IDs keep the distinct-per-text count a pure integer sort
+    vocabulary: dict[str, int] = {}
+    token_ids = np.fromiter(
+        (vocabulary.setdefault(token, len(vocabulary)) for token in chain(*token_lists)),
+        dtype=np.int64,
+        count=total,
+    )
+    doc_tokens = np.unique(doc_index * len(vocabulary) + token_ids)
+    vocabulary_size = np.bincount(doc_tokens // len(vocabulary), minlength=n)
+
+    token_lengths = np.fromiter(map(len, chain(*token_lists)), dtype=np.int64, count=total)
+    token_chars = np.bincount(doc_index, weights=token_lengths, minlength=n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lexical_diversity = np.where(token_counts > 0, vocabulary_size / token_counts, 0.0)
+        avg_word_length = np.where(token_counts > 0, token_chars / token_counts, 0.0)
+
+    return vocabulary_size, lexical_diversity, avg_word_length
+
+
+def compute_text_features(
+    titles: list[str], alts: list[str], transcripts: list[str]
+) -> dict[str, np.ndarray]:
+    """Compute text features for a chunk of comics, one array per feature."""
+    title_words = word_counts(titles)
+    alt_words = word_counts(alts)
+    transcript_words = word_counts(transcripts)
+    vocabulary_size, lexical_diversity, avg_word_length = vocabulary_stats(
+        [f"{t} {a} {tr}" for t, a, tr in zip(titles, alts, transcripts, strict=True)]
+    )
+
+    return {
+        "title_word_count": title_words,
+        "alt_word_count": alt_words,
+        "alt_char_length": text_lengths(alts),
+        "transcript_word_count": transcript_words,
+        "transcript_char_length": text_lengths(transcripts),
+        "reading_time_seconds": (title_words + alt_words + transcript_words)
+        * 60.0
+        / WORDS_PER_MINUTE,
+        "vocabulary_size": vocabulary_size,
+        "lexical_diversity": lexical_diversity,
+        "avg_word_length": avg_word_length,
+    }
+
+
+def _write_features(
+    conn: psycopg2.extensions.connection,
+    comic_ids: tuple[int, ...],
+    load_ids: tuple[str, ...],
+    features: dict[str, np.ndarray],
+) -> None:
+    """Bulk upsert one chunk of features."""
+    columns = [np.asarray(features[name]).tolist() for name in FEATURE_COLUMNS]
+    rows = list(zip(comic_ids, load_ids, *columns, strict=True))
+    with conn.cursor() as cur:
+        execute_values(
+            cur,
+            f"""
+            insert into features.comic_text_features (
+                comic_id, load_id, {", ".join(FEATURE_COLUMNS)}
+            )
+            values %s
+            on conflict (comic_id) do nothing
+            """,
+            rows,
+            page_size=1000,
+        )
+
+
+def process_new_comics(
+    conn: psycopg2.extensions.connection,
+    load_id: str | None = None,
+    since_load_ts: str | None = None,
+    chunk_size: int = 10000,
+) -> int:
+    """Compute and store features for comics without features, committing per chunk.
+
+    since_load_ts limits the scan to recent loads instead of anti-joining the whole
+    raw table.
+    """
+    processed = 0
+    # withhold keeps the server-side cursor open across the per-chunk commits
+    with conn.cursor(name="new_comic_texts", withhold=True) as cur:
+        cur.itersize = chunk_size
+        cur.execute(NEW_COMICS_QUERY, {"load_id": load_id, "since_load_ts": since_load_ts})
+
+        while rows := cur.fetchmany(chunk_size):
+            comic_ids, load_ids, titles, alts, transcripts = zip(*rows, strict=True)
+            features = compute_text_features(list(titles), list(alts), list(transcripts))
+            _write_features(conn, comic_ids, load_ids, features)
+            conn.commit()
+
+            processed += len(rows)
+            logger.info(f"Computed text features for {processed} comics")
+
+    conn.commit()
+    return processed
+
+
+def benchmark(conn: psycopg2.extensions.connection, limit: int) -> dict[str, float]:
+    """Time the NumPy stage against the per-row SQL equivalent over the same comics."""
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            select
+                coalesce(raw_json ->> 'title', ''),
+                coalesce(raw_json ->> 'alt', ''),
+                coalesce(raw_json ->> 'transcript', '')
+            from raw.xkcd_comics
+            order by comic_id
+            limit %s
+            """,
+            (limit,),
+        )
+        rows = cur.fetchall()
+    if rows:
+        titles, alts, transcripts = zip(*rows, strict=True)
+        compute_text_features(list(titles), list(alts), list(transcripts))
+    numpy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(SQL_FEATURES_QUERY, {"limit": limit, "wpm": WORDS_PER_MINUTE})
+        cur.fetchall()
+    sql_seconds = time.perf_counter() - start
+
+    conn.rollback()
+    return {"rows": len(rows), "numpy_seconds": numpy_seconds, "sql_seconds": sql_seconds}
+
+
+def run_text_features(
+    load_id: str | None = None, since_load_ts: str | None = None, chunk_size: int = 10000
+) -> int:
+    """Compute text features for new comics, returning the number processed."""
+    with XKCDLoader() as loader:
+        processed = process_new_comics(loader.conn, load_id, since_load_ts, chunk_size)
+
+    logger.info(f"Text features complete: {processed} new comics processed")
+    return processed
+
+
+def main():
+    """Compute text features for new comics, or benchmark the stage."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--load-id", default=None, help="only process comics from this load")
+    parser.add_argument(
+        "--since-load-ts", default=None, help="only process comics loaded at or after this time"
+    )
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--benchmark", type=int, metavar="ROWS", help="compare with SQL")
+    args = parser.parse_args()
+
+    try:
+        if args.benchmark:
+            with XKCDLoader() as loader:
+                result = benchmark(loader.conn, args.benchmark)
+            logger.info(
+                f"{result['rows']} comics: numpy {result['numpy_seconds']:.2f}s, "
+                f"sql {result['sql_seconds']:.2f}s"
+            )
+        else:
+            run_text_features(args.load_id, args.since_load_ts, args.chunk_size)
+
+    except (RuntimeError, psycopg2.Error) as e:
+        logger.error(f"Text feature stage failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Ingestion Worker - Long-lived daemon that keeps HTTP sessions and DB connections warm.
+
+Airflow tasks talk to it through ingestion.client instead of importing the ingestion
+stack and opening new sessions and connections on every run.
+"""
+
+import argparse
+import json
+import logging
+import socketserver
+import statistics
+import subprocess
+import sys
+import time
+
+import psycopg2
+import requests
+
+from ingestion.client import worker_address
+from ingestion.extractor import XKCDExtractor
+from ingestion.loader import XKCDLoader
+from ingestion.poller import is_new_comic_available
+from ingestion.run_ingestion import ingest
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COLD_START_SNIPPET = (
+    "from ingestion.poller import check_new_comic_available; check_new_comic_available()"
+)
+WARM_START_SNIPPET = "from ingestion.client import send_command; send_command('check')"
+REQUEST_READ_TIMEOUT_SECONDS = 10.0
+
+
+class IngestionWorker:
+    """Run ingestion commands against a warm extractor session and loader connection."""
+
+    def __init__(self, extractor: XKCDExtractor | None = None, loader: XKCDLoader | None = None):
+        """Initialise worker with a shared extractor and loader."""
+        self.extractor = extractor if extractor is not None else XKCDExtractor()
+        self.loader = loader if loader is not None else XKCDLoader()
+
+    def _ensure_connected(self) -> None:
+        """Reconnect if the database connection was dropped since the last command."""
+        if self.loader.conn is not None and self.loader.conn.closed:
+            logger.warning("Database connection lost, reconnecting")
+            self.loader.conn = None
+        if self.loader.conn is None:
+            self.loader.connect()
+
+    def handle(self, command: str) -> dict:
+        """Run a single command and build the response."""
+        try:
+            if command == "ping":
+                result = True
+            elif command == "check":
+                self._ensure_connected()
+                result = is_new_comic_available(self.extractor, self.loader)
+            elif command == "ingest":
+                self._ensure_connected()
+                result = ingest(self.extractor, self.loader)
+            else:
+                return {"ok": False, "error": f"Unknown command: {command}"}
+
+        except psycopg2.Error as e:
+            logger.error(f"Command '{command}' failed: {e}", exc_info=True)
+            # Drop the connection so the next command starts from a clean one
+            self.loader.disconnect()
+            return {"ok": False, "error": str(e)}
+        except (RuntimeError, requests.RequestException) as e:
+            logger.error(f"Command '{command}' failed: {e}", exc_info=True)
+            return {"ok": False, "error": str(e)}
+        finally:
+            # Do not leave the warm connection idle in transaction between commands
+            if self.loader.conn is not None and not self.loader.conn.closed:
+                self.loader.conn.rollback()
+
+        return {"ok": True, "result": result}
+
+    def close(self) -> None:
+        """Close the extractor session and database connection."""
+        self.extractor.session.close()
+        self.loader.disconnect()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON-line request per connection."""
+
+    # Requests are served one at a time, so a client that connects and never sends
+    # a request (port probes, half-open connections) must not block the server
+    timeout = REQUEST_READ_TIMEOUT_SECONDS
+
+    def handle(self) -> None:
+        try:
+            line = self.rfile.readline()
+        except TimeoutError:
+            logger.warning(f"No request from {self.client_address[0]} within {self.timeout}s")
+            line = b"\n"
+        if not line:
+            return
+
+        try:
+            command = json.loads(line)["command"]
+        except (ValueError, KeyError, TypeError):
+            response = {"ok": False, "error": "Malformed request"}
+        else:
+            logger.info(f"Received command '{command}' from {self.client_address[0]}")
+            response = self.server.worker.handle(command)
+
+        try:
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+        except OSError as e:
+            # Clients give up on checks that queued behind a long request
+            logger.warning(f"Client {self.client_address[0]} left before the response: {e}")
+
+
+class WorkerServer(socketserver.TCPServer):
+    """Single-threaded server, so ingestion commands never run concurrently."""
+
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], worker: IngestionWorker):
+        """Bind the server and attach the worker that executes commands."""
+        super().__init__(address, _RequestHandler)
+        self.worker = worker
+
+
+def measure_startup_latency(snippet: str, repeat: int = 5) -> list[float]:
+    """Time fresh processes from start until the snippet's first request completes."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", snippet], check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def serve(host: str, port: int) -> None:
+    """Run the worker until interrupted."""
+    worker = IngestionWorker()
+    try:
+        with WorkerServer((host, port), worker) as server:
+            logger.info(f"Ingestion worker listening on {host}:{port}")
+            server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Ingestion worker stopped")
+    finally:
+        worker.close()
+
+
+def report_latency(repeat: int) -> None:
+    """Compare startup-to-first-request latency of cold processes and the warm worker."""
+    for mode, snippet in (("cold", COLD_START_SNIPPET), ("warm", WARM_START_SNIPPET)):
+        timings = measure_startup_latency(snippet, repeat)
+        logger.info(
+            f"{mode}: median {statistics.median(timings) * 1000:.0f} ms, "
+            f"min {min(timings) * 1000:.0f} ms over {repeat} runs"
+        )
+
+
+def main():
+    """Run the worker daemon or measure startup latency."""
+    host, port = worker_address()
+    parser = argparse.ArgumentParser(description="XKCD ingestion worker")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="run the worker daemon")
+    serve_parser.add_argument("--host", default=host)
+    serve_parser.add_argument("--port", type=int, default=port)
+
+    latency_parser = subparsers.add_parser("latency", help="compare cold and warm startup")
+    latency_parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        serve(args.host, args.port)
+    else:
+        report_latency(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,49 @@ create table if not exists raw.xkcd_comics (
 
 create index if not exists idx_xkcd_comics_load_ts on raw.xkcd_comics(load_ts);
 create index if not exists idx_xkcd_comics_load_id on raw.xkcd_comics(load_id);
+
+-- Comics rejected by the loader's quality gate (ingestion.quality), latest rejection per comic
+create table if not exists raw.xkcd_comics_quarantine (
+    comic_id integer primary key,
+    raw_json jsonb not null,
+    reasons text[] not null,
+    load_ts timestamp not null default current_timestamp,
+    load_id uuid not null
+);
+
+
+-- Text features per comic, written by ingestion.text_features
+create schema if not exists features;
+
+create table if not exists features.comic_text_features (
+    comic_id integer primary key,
+    load_id uuid not null,
+    title_word_count integer not null,
+    alt_word_count integer not null,
+    alt_char_length integer not null,
+    transcript_word_count integer not null,
+    transcript_char_length integer not null,
+    reading_time_seconds double precision not null,
+    vocabulary_size integer not null,
+    lexical_diversity double precision not null,
+    avg_word_length double precision not null,
+    computed_ts timestamp not null default current_timestamp
+);
+
+create index if not exists idx_comic_text_features_load_id on features.comic_text_features(load_id);
+
+-- dbt benchmark history, written by ingestion.dbt_benchmark
+create schema if not exists benchmark;
+
+create table if not exists benchmark.dbt_node_timings (
+    invocation_id uuid not null,
+    generated_at timestamp not null,
+    raw_row_count bigint not null,
+    unique_id text not null,
+    resource_type text not null,
+    status text not null,
+    execution_time_s double precision not null,
+    primary key (invocation_id, unique_id)
+);
+
+create index if not exists idx_dbt_node_timings_unique_id on benchmark.dbt_node_timings(unique_id, raw_row_count);